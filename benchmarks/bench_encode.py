@@ -0,0 +1,53 @@
+"""
+JSONB encode cost of PydanticTypeModel.to_db_row() for an AnalysisRequest
+with large VirtualFile.content / ShellCapture.stdout strings: the previous
+`Jsonb(model_dump())` + stdlib json path versus pydantic-core JSON bytes.
+
+Both sides run psycopg's jsonb dumper (text for INSERT, binary for COPY),
+i.e. everything up to the bytes that go on the wire.
+
+    PYTHONPATH=src python benchmarks/bench_encode.py [--size BYTES] [-n ITERATIONS]
+"""
+import argparse
+import time
+from psycopg.types.json import Jsonb, JsonbBinaryDumper, JsonbDumper
+from pygres.examples.eg import AnalysisRow
+from pygres.examples.models import AnalysisRequest, KnowledgeBlob, ShellCapture, VirtualFile
+
+def make_row(size: int) -> AnalysisRow:
+    return AnalysisRow(input=AnalysisRequest(
+        files=[VirtualFile(path=f"src/F{i}.cs", content="class Foo { }\n" * (size // 14), language="cs") for i in range(4)],
+        knowledge=[KnowledgeBlob(kind="notes", payload="n" * (size // 4))],
+        shell=[ShellCapture(command="dotnet build", stdout="ok\n" * (size // 3), exit_code=0)],
+    ))
+
+def legacy_to_db_row(row: AnalysisRow) -> dict:
+    # previous encoder: full dict tree, re-serialized by psycopg with json.dumps
+    return {
+        name: None if getattr(row, name) is None else Jsonb(getattr(row, name).model_dump())
+        for name in row.schema_info()["pydantic_fields"]
+    }
+
+def bench(to_row, row, dumper, n: int) -> float:
+    start = time.perf_counter()
+    for _ in range(n):
+        for value in to_row(row).values():
+            if isinstance(value, Jsonb):
+                dumper.dump(value)
+    return (time.perf_counter() - start) / n * 1e3
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--size", type=int, default=1_000_000, help="approx. bytes per large string")
+    parser.add_argument("-n", type=int, default=50)
+    args = parser.parse_args()
+
+    row = make_row(args.size)
+    for label, dumper in (("text", JsonbDumper(Jsonb)), ("binary", JsonbBinaryDumper(Jsonb))):
+        before = bench(legacy_to_db_row, row, dumper, args.n)
+        after = bench(AnalysisRow.to_db_row, row, dumper, args.n)
+        print(f"{label:6} model_dump + json.dumps: {before:8.2f} ms/row")
+        print(f"{label:6} pydantic-core bytes:     {after:8.2f} ms/row  ({before / after:.2f}x)")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+"""
+Per-row client overhead of PydanticTypeTable.add(): statements rebuilt as
+`sql.Composed` on every call (the previous behaviour) versus the statements
+compiled once per table.
+
+Each fake call runs psycopg's own query conversion (composition, placeholder
+parsing, parameter dumping) so the numbers reflect what happens client side
+before anything is sent to the server.
+
+    PYTHONPATH=src python benchmarks/bench_prepared.py [-n ROWS]
+"""
+import argparse
+import time
+from psycopg import sql
+from psycopg._queries import PostgresQuery
+from psycopg.adapt import Transformer
+from pygres.examples.eg import AnalysisRow, AnalysisTable
+from pygres.examples.models import AnalysisRequest, VirtualFile
+
+class ConvertingDB:
+    """
+    FakeDB variant that converts every query the way a psycopg cursor would.
+    """
+    def __init__(self):
+        self.tx = Transformer()
+
+    def _convert(self, query, params):
+        PostgresQuery(self.tx).convert(query, params)
+
+    def execute(self, query, params=None, prepare=None):
+        self._convert(query, params)
+        return 1
+
+    def fetch_val(self, query, params=None, prepare=None):
+        self._convert(query, params)
+        return 42
+
+def legacy_add(table, instance):
+    # previous add(): identifiers, placeholders and Composed rebuilt per call
+    row = instance.to_db_row()
+    insert_sql = sql.SQL("INSERT INTO {} ({}) VALUES ({}) RETURNING id").format(
+        table.table_name_ident,
+        sql.SQL(", ").join(sql.Identifier(k) for k in row.keys()),
+        sql.SQL(", ").join(sql.Placeholder(k) for k in row.keys()),
+    )
+    instance.id = table.db.fetch_val(insert_sql, row)
+    return instance
+
+def bench(fn, table, rows) -> float:
+    start = time.perf_counter()
+    for r in rows:
+        fn(table, r)
+    return (time.perf_counter() - start) / len(rows) * 1e6
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("-n", type=int, default=20000)
+    args = parser.parse_args()
+
+    table = AnalysisTable(ConvertingDB())
+    rows = [
+        AnalysisRow(input=AnalysisRequest(files=[VirtualFile(content="class Foo {}", language="cs")]))
+        for _ in range(args.n)
+    ]
+
+    # warm up psycopg's query cache and adapters
+    bench(legacy_add, table, rows[:100])
+    bench(AnalysisTable.add, table, rows[:100])
+
+    before = bench(legacy_add, table, rows)
+    after = bench(AnalysisTable.add, table, rows)
+    print(f"rows={args.n}")
+    print(f"composed per call: {before:8.2f} us/row")
+    print(f"compiled once:     {after:8.2f} us/row  ({before / after:.2f}x)")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,180 @@
+import asyncio
+import uuid
+from contextlib import asynccontextmanager
+import psycopg
+from psycopg.sql import SQL, Composed
+from psycopg.adapt import Loader
+from typing import Any, AsyncIterator, Iterable, Sequence
+from pygres.db.database import Database, PoolConfig, register_loaders
+
+class AsyncDatabase:
+    """
+    asyncio counterpart of `Database`, built on `psycopg.AsyncConnection`
+    (or a psycopg-pool `AsyncConnectionPool` when given a `PoolConfig`).
+
+    Create instances with `await AsyncDatabase.connect(...)`.
+    """
+    def __init__(self, conn: psycopg.AsyncConnection | None = None, pool=None):
+        self.conn = conn
+        self.pool = pool
+        # single-connection mode: concurrent tasks take turns
+        self._lock = asyncio.Lock()
+
+    @classmethod
+    async def connect(cls, pool: PoolConfig | None = None, **kwargs) -> "AsyncDatabase":
+        if pool is None:
+            return cls(conn=await psycopg.AsyncConnection.connect(**kwargs))
+
+        return cls(pool=await cls._open_pool(pool, kwargs))
+
+    @staticmethod
+    async def _open_pool(config: PoolConfig, kwargs: dict[str, Any]):
+        try:
+            from psycopg_pool import AsyncConnectionPool
+        except ImportError as e:
+            raise ImportError(
+                "Pooled AsyncDatabase requires psycopg-pool: pip install 'Pygres[pool]'"
+            ) from e
+
+        pool = AsyncConnectionPool(
+            kwargs=kwargs,
+            min_size=config.min_size,
+            max_size=config.max_size,
+            max_idle=config.max_idle,
+            timeout=config.timeout,
+            check=AsyncConnectionPool.check_connection if config.check else None,
+            open=False,
+        )
+        await pool.open()
+        return pool
+
+    @asynccontextmanager
+    async def connection(self) -> AsyncIterator[psycopg.AsyncConnection]:
+        """
+        Borrow a connection for the duration of the block.
+        """
+        if self.pool is not None:
+            async with self.pool.connection() as conn:
+                yield conn
+            return
+
+        assert self.conn is not None
+        async with self._lock:
+            try:
+                yield self.conn
+            except BaseException:
+                await self.conn.rollback()
+                raise
+
+    async def close(self):
+        if self.pool is not None:
+            await self.pool.close()
+        if self.conn is not None:
+            await self.conn.close()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        await self.close()
+
+    _normalize_query = Database._normalize_query
+
+    async def execute(
+        self,
+        query: str | bytes | SQL | Composed,
+        params: dict[str, Any] | None = None,
+        prepare: bool | None = None,
+    ):
+        q = self._normalize_query(query)
+        async with self.connection() as conn:
+            async with conn.cursor() as cur:
+                await cur.execute(q, params, prepare=prepare)
+                count = cur.rowcount
+            await conn.commit()
+        return count
+
+    async def fetch_val(
+        self,
+        query: str | bytes | SQL | Composed,
+        params: dict[str, Any] | None = None,
+        prepare: bool | None = None,
+    ):
+        q = self._normalize_query(query)
+        async with self.connection() as conn:
+            async with conn.cursor() as cur:
+                await cur.execute(q, params, prepare=prepare)
+                row = await cur.fetchone()
+            await conn.commit()
+        return row[0] if row else None
+
+    async def fetch_one(
+        self,
+        query: str | bytes | SQL | Composed,
+        params: dict[str, Any] | None = None,
+        prepare: bool | None = None,
+        loaders: Sequence[tuple[str, type[Loader]]] | None = None,
+    ):
+        q = self._normalize_query(query)
+        async with self.connection() as conn:
+            async with conn.cursor() as cur:
+                register_loaders(cur, loaders)
+                await cur.execute(q, params, prepare=prepare)
+                row = await cur.fetchone()
+            await conn.commit()
+        return row
+
+    async def fetch_all(
+        self,
+        query: str | bytes | SQL | Composed,
+        params: dict[str, Any] | None = None,
+        prepare: bool | None = None,
+        loaders: Sequence[tuple[str, type[Loader]]] | None = None,
+    ):
+        q = self._normalize_query(query)
+        async with self.connection() as conn:
+            async with conn.cursor() as cur:
+                register_loaders(cur, loaders)
+                await cur.execute(q, params, prepare=prepare)
+                rows = await cur.fetchall()
+            await conn.commit()
+        return rows
+
+    async def stream(
+        self,
+        query: str | bytes | SQL | Composed,
+        params: dict[str, Any] | None = None,
+        batch_size: int = 1000,
+        loaders: Sequence[tuple[str, type[Loader]]] | None = None,
+    ) -> AsyncIterator[tuple[Any, ...]]:
+        """
+        Iterate over a query's rows through a named (server-side) cursor;
+        see `Database.stream`.
+        """
+        q = self._normalize_query(query)
+        async with self.connection() as conn:
+            async with conn.cursor(name=f"pygres_{uuid.uuid4().hex}") as cur:
+                cur.itersize = batch_size
+                register_loaders(cur, loaders)
+                await cur.execute(q, params)
+                async for row in cur:
+                    yield row
+            await conn.commit()
+
+    async def copy_rows(
+        self,
+        query: str | bytes | SQL | Composed,
+        rows: Iterable[Sequence[Any]],
+        types: Sequence[str] | None = None,
+    ) -> int:
+        q = self._normalize_query(query)
+        async with self.connection() as conn:
+            async with conn.cursor() as cur:
+                async with cur.copy(q) as copy:
+                    if types is not None:
+                        copy.set_types(types)
+                    for row in rows:
+                        await copy.write_row(row)
+                count = cur.rowcount
+            await conn.commit()
+        return count
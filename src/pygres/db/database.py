@@ -1,37 +1,342 @@
+import threading
+import uuid
+from contextlib import contextmanager
+from contextvars import ContextVar
 import psycopg
 from psycopg import sql
 from psycopg.sql import SQL, Composed
-from typing import Any
+from pydantic import BaseModel
+from psycopg.adapt import Loader
+from typing import Any, Callable, Iterable, Iterator, Sequence
+
+# results waiting on a pipeline sync before their callbacks can run
+PIPELINE_MAX_PENDING = 1000
+
+class PoolConfig(BaseModel):
+    """
+    Settings for a pooled `Database`; each call borrows a connection
+    from the pool only for its own duration.
+    """
+    min_size: int = 1
+    max_size: int | None = None
+    max_idle: float = 600.0
+    timeout: float = 30.0
+    # run a trivial query on checkout and discard broken connections
+    check: bool = True
+
+def register_loaders(
+    cur: psycopg.Cursor | psycopg.AsyncCursor,
+    loaders: Sequence[tuple[str, type[Loader]]] | None,
+):
+    """
+    Override `(type name, loader)` pairs on this cursor only,
+    e.g. `pygres.models.codec.RAW_JSONB_LOADERS`.
+    """
+    for type_name, loader in loaders or ():
+        cur.adapters.register_loader(type_name, loader)
+
+class _Scope:
+    """
+    A connection pinned by `Database.transaction()` / `Database.pipeline()`
+    for the current thread or task.
+    """
+    def __init__(self, conn: psycopg.Connection):
+        self.conn = conn
+        self.pipeline: psycopg.Pipeline | None = None
+        self.pending: list[tuple[psycopg.Cursor, Callable[[Any], None]]] = []
+
+    def resolve_pending(self):
+        assert self.pipeline is not None
+        self.pipeline.sync()
+
+        pending, self.pending = self.pending, []
+        for cur, callback in pending:
+            row = cur.fetchone()
+            cur.close()
+            callback(row[0] if row else None)
 
 class Database:
-    def __init__(self, **kwargs):
-        self.conn = psycopg.connect(**kwargs)
+    def __init__(self, pool: PoolConfig | None = None, **kwargs):
+        self.conninfo = kwargs
+        self.conn: psycopg.Connection | None = None
+        self.pool = None
+        # single-connection mode: calls from different threads take turns
+        self._lock = threading.RLock()
+        self._scope: ContextVar[_Scope | None] = ContextVar(f"pygres_scope_{id(self)}", default=None)
+
+        if pool is None:
+            self.conn = psycopg.connect(**kwargs)
+        else:
+            self.pool = self._open_pool(pool, kwargs)
+
+    @staticmethod
+    def _open_pool(config: PoolConfig, kwargs: dict[str, Any]):
+        try:
+            from psycopg_pool import ConnectionPool
+        except ImportError as e:
+            raise ImportError(
+                "Pooled Database requires psycopg-pool: pip install 'Pygres[pool]'"
+            ) from e
+
+        return ConnectionPool(
+            kwargs=kwargs,
+            min_size=config.min_size,
+            max_size=config.max_size,
+            max_idle=config.max_idle,
+            timeout=config.timeout,
+            check=ConnectionPool.check_connection if config.check else None,
+            open=True,
+        )
+
+    @contextmanager
+    def connection(self) -> Iterator[psycopg.Connection]:
+        """
+        Borrow a connection for the duration of the block
+        (the pinned one inside `transaction()` / `pipeline()`).
+        """
+        scope = self._scope.get()
+        if scope is not None:
+            yield scope.conn
+            return
+
+        if self.pool is not None:
+            with self.pool.connection() as conn:
+                yield conn
+            return
+
+        assert self.conn is not None
+        with self._lock:
+            try:
+                yield self.conn
+            except BaseException:
+                self.conn.rollback()
+                raise
+
+    @contextmanager
+    def transaction(self) -> Iterator["Database"]:
+        """
+        Run every call in the block on one connection and commit once at the end
+        (rollback on error). Nested blocks become savepoints.
+        """
+        scope = self._scope.get()
+        if scope is not None:
+            if scope.pipeline is not None:
+                scope.resolve_pending()
+            with scope.conn.transaction():
+                yield self
+            return
+
+        with self.connection() as conn:
+            token = self._scope.set(_Scope(conn))
+            try:
+                yield self
+            except BaseException:
+                conn.rollback()
+                raise
+            else:
+                conn.commit()
+            finally:
+                self._scope.reset(token)
+
+    @contextmanager
+    def pipeline(self) -> Iterator["Database"]:
+        """
+        Transaction in psycopg pipeline mode: statements are sent without waiting
+        for each reply. Results of `submit_val()` (used by `PydanticTypeTable.add`)
+        are delivered when the pipeline syncs, at the latest when the block exits.
+        `execute()` cannot report a row count here (-1) and COPY is not available.
+        """
+        scope = self._scope.get()
+        if scope is not None and scope.pipeline is not None:
+            yield self
+            return
+
+        with self.transaction():
+            scope = self._scope.get()
+            assert scope is not None
+            with scope.conn.pipeline() as p:
+                scope.pipeline = p
+                try:
+                    yield self
+                    scope.resolve_pending()
+                finally:
+                    scope.pipeline = None
+                    scope.pending.clear()
+
+    @contextmanager
+    def detached(self) -> Iterator["Database"]:
+        """
+        A `Database` whose calls run outside the current `transaction()` /
+        `pipeline()` scope and commit on their own (used for schema bootstrap).
+        Pooled: the same instance on another pool connection.
+        Single-connection: a short-lived second connection while a scope is active.
+        """
+        if self._scope.get() is None:
+            yield self
+            return
 
-    def _normalize_query(self, query: str | SQL | Composed) -> SQL | Composed:
-        if isinstance(query, (SQL, Composed)):
+        if self.pool is not None:
+            token = self._scope.set(None)
+            try:
+                yield self
+            finally:
+                self._scope.reset(token)
+            return
+
+        with Database(**self.conninfo) as other:
+            yield other
+
+    def _commit(self, conn: psycopg.Connection):
+        # inside transaction()/pipeline() the scope commits once on exit
+        if self._scope.get() is None:
+            conn.commit()
+
+    def close(self):
+        if self.pool is not None:
+            self.pool.close()
+        if self.conn is not None:
+            self.conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def _normalize_query(self, query: str | bytes | SQL | Composed) -> bytes | SQL | Composed:
+        if isinstance(query, (bytes, SQL, Composed)):
+            # bytes are pre-rendered statements (see TableBase.statements):
+            # passed through untouched so psycopg can cache and prepare them
             return query
         # fallback: treat raw string as literal SQL fragment
         return Composed([sql.SQL(query)]) # type: ignore[arg-type]
 
-    def execute(self, query: str | SQL | Composed, params: dict[str, Any] | None = None):
+    def execute(
+        self,
+        query: str | bytes | SQL | Composed,
+        params: dict[str, Any] | None = None,
+        prepare: bool | None = None,
+    ):
         q = self._normalize_query(query)
-        with self.conn.cursor() as cur:
-            cur.execute(q, params)
-        self.conn.commit()
+        with self.connection() as conn:
+            with conn.cursor() as cur:
+                cur.execute(q, params, prepare=prepare)
+                count = cur.rowcount
+            self._commit(conn)
+        return count
 
-    def fetch_val(self, query: str | SQL | Composed, params: dict[str, Any] | None = None):
+    def fetch_val(
+        self,
+        query: str | bytes | SQL | Composed,
+        params: dict[str, Any] | None = None,
+        prepare: bool | None = None,
+    ):
         q = self._normalize_query(query)
-        with self.conn.cursor() as cur:
-            cur.execute(q, params)
-            row = cur.fetchone()
-        self.conn.commit()
+        with self.connection() as conn:
+            with conn.cursor() as cur:
+                cur.execute(q, params, prepare=prepare)
+                row = cur.fetchone()
+            self._commit(conn)
         return row[0] if row else None
 
-    def fetch_one(self, query: str | SQL | Composed, params: dict[str, Any] | None = None):
+    def fetch_one(
+        self,
+        query: str | bytes | SQL | Composed,
+        params: dict[str, Any] | None = None,
+        prepare: bool | None = None,
+        loaders: Sequence[tuple[str, type[Loader]]] | None = None,
+    ):
         q = self._normalize_query(query)
-        with self.conn.cursor() as cur:
-            cur.execute(q, params)
-            row = cur.fetchone()
-        self.conn.commit()
+        with self.connection() as conn:
+            with conn.cursor() as cur:
+                register_loaders(cur, loaders)
+                cur.execute(q, params, prepare=prepare)
+                row = cur.fetchone()
+            self._commit(conn)
         return row
-    
\ No newline at end of file
+
+    def fetch_all(
+        self,
+        query: str | bytes | SQL | Composed,
+        params: dict[str, Any] | None = None,
+        prepare: bool | None = None,
+        loaders: Sequence[tuple[str, type[Loader]]] | None = None,
+    ):
+        q = self._normalize_query(query)
+        with self.connection() as conn:
+            with conn.cursor() as cur:
+                register_loaders(cur, loaders)
+                cur.execute(q, params, prepare=prepare)
+                rows = cur.fetchall()
+            self._commit(conn)
+        return rows
+
+    def stream(
+        self,
+        query: str | bytes | SQL | Composed,
+        params: dict[str, Any] | None = None,
+        batch_size: int = 1000,
+        loaders: Sequence[tuple[str, type[Loader]]] | None = None,
+    ) -> Iterator[tuple[Any, ...]]:
+        """
+        Iterate over a query's rows through a named (server-side) cursor,
+        fetching `batch_size` rows per round trip.
+
+        The connection stays borrowed until the iterator is exhausted or closed;
+        in single-connection mode, don't write through the same `Database`
+        from inside the loop (its commit would close the cursor).
+        """
+        q = self._normalize_query(query)
+        with self.connection() as conn:
+            with conn.cursor(name=f"pygres_{uuid.uuid4().hex}") as cur:
+                cur.itersize = batch_size
+                register_loaders(cur, loaders)
+                cur.execute(q, params)
+                yield from cur
+            self._commit(conn)
+
+    def submit_val(
+        self,
+        query: str | bytes | SQL | Composed,
+        params: dict[str, Any] | None,
+        callback: Callable[[Any], None],
+        prepare: bool | None = None,
+    ):
+        """
+        Like `fetch_val`, but hands the value to `callback` instead of returning it.
+        Outside a pipeline the callback runs immediately; inside one it runs when
+        the pipeline syncs, so a burst of statements costs no round trip each.
+        """
+        scope = self._scope.get()
+        if scope is None or scope.pipeline is None:
+            callback(self.fetch_val(query, params, prepare=prepare))
+            return
+
+        cur = scope.conn.cursor()
+        cur.execute(self._normalize_query(query), params, prepare=prepare)
+        scope.pending.append((cur, callback))
+
+        if len(scope.pending) >= PIPELINE_MAX_PENDING:
+            scope.resolve_pending()
+
+    def copy_rows(
+        self,
+        query: str | bytes | SQL | Composed,
+        rows: Iterable[Sequence[Any]],
+        types: Sequence[str] | None = None,
+    ) -> int:
+        """
+        Stream `rows` through a `COPY ... FROM STDIN` statement.
+        `types` (postgres type names, one per column) is required for BINARY format.
+        """
+        q = self._normalize_query(query)
+        with self.connection() as conn:
+            with conn.cursor() as cur:
+                with cur.copy(q) as copy:
+                    if types is not None:
+                        copy.set_types(types)
+                    for row in rows:
+                        copy.write_row(row)
+                count = cur.rowcount
+            self._commit(conn)
+        return count
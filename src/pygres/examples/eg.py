@@ -1,6 +1,7 @@
 from pydantic import PrivateAttr
 from pygres.examples.models import AnalysisRequest, BulkDiagramResponse
 from pygres.models.base_model import PydanticTypeModel
+from pygres.tables.async_table import AsyncPydanticTypeTable
 from pygres.tables.table import PydanticTypeTable
 
 class AnalysisRow(PydanticTypeModel):
@@ -15,3 +16,8 @@ class AnalysisRow(PydanticTypeModel):
 class AnalysisTable(PydanticTypeTable):
     def __init__(self, db):
         super().__init__(db, AnalysisRow)
+
+
+class AsyncAnalysisTable(AsyncPydanticTypeTable):
+    def __init__(self, db):
+        super().__init__(db, AnalysisRow)
@@ -1,6 +1,8 @@
 from typing import ClassVar, Dict, Any
-from pydantic import BaseModel
+from pydantic import BaseModel, TypeAdapter
+from pydantic_core import from_json
 from psycopg.types.json import Jsonb
+from pygres.models.codec import DecodeMode, construct_trusted
 from pygres.models.metaclass import PydanticTypeModelMeta
 
 
@@ -14,15 +16,32 @@ class PydanticTypeModel(BaseModel, metaclass=PydanticTypeModelMeta):
     def schema_info(cls):
         return cls._model_registry
 
+    @classmethod
+    def field_adapters(cls) -> Dict[str, TypeAdapter]:
+        """
+        One cached `TypeAdapter` per JSONB field, built from the field's full annotation.
+        """
+        reg = cls.schema_info()
+        adapters = reg.get("adapters")
+        if adapters is None:
+            adapters = {
+                name: TypeAdapter(cls.model_fields[name].annotation)
+                for name in reg["pydantic_fields"]
+            }
+            reg["adapters"] = adapters
+        return adapters
+
     def to_db_row(self):
         row = {}
         reg = self.schema_info()
 
         # Serialize nested Pydantic models → JSONB
+        # (pydantic-core writes the JSON bytes; psycopg sends them as is)
+        adapters = self.field_adapters()
         for name in reg["pydantic_fields"]:
             value = getattr(self, name)
             if value is not None:
-                row[name] = Jsonb(value.model_dump())
+                row[name] = Jsonb(value, dumps=adapters[name].dump_json)
             else:
                 row[name] = None
 
@@ -33,18 +52,35 @@ class PydanticTypeModel(BaseModel, metaclass=PydanticTypeModelMeta):
         return row
 
     @classmethod
-    def from_db_row(cls, row):
+    def from_db_row(cls, row, decode: DecodeMode = "python"):
+        """
+        Rebuild a model from a row dict. JSONB values may arrive parsed
+        (dicts) or raw (bytes, see `RawJsonbLoader`); `decode` picks how
+        they are validated.
+        """
         reg = cls.schema_info()
         kwargs = {}
 
         # Deserialize JSONB → Pydantic
         for name, model_type in reg["pydantic_fields"].items():
-            if row.get(name) is not None:
-                kwargs[name] = model_type(**row[name])
+            value = row.get(name)
+            if value is None:
+                continue
+
+            if decode == "trusted":
+                if isinstance(value, (bytes, str)):
+                    value = from_json(value)
+                kwargs[name] = construct_trusted(cls.model_fields[name].annotation, value)
+            elif isinstance(value, (bytes, str)):
+                kwargs[name] = cls.field_adapters()[name].validate_json(value)
+            else:
+                kwargs[name] = model_type(**value)
 
         # Copy scalar SQL fields
         for name in reg["sql_fields"]:
             kwargs[name] = row.get(name)
 
         kwargs["id"] = row.get("id")
-        return cls(**kwargs)
\ No newline at end of file
+        if decode == "trusted":
+            return cls.model_construct(**kwargs)
+        return cls(**kwargs)
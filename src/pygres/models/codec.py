@@ -0,0 +1,108 @@
+import types
+from functools import lru_cache
+from typing import Any, Callable, Literal, Union, get_args, get_origin
+from psycopg.adapt import Loader
+from psycopg.types.json import JsonbBinaryLoader, JsonbLoader
+from pydantic import BaseModel
+from pygres.models.metaclass import issubclass_safe
+
+# How JSONB columns are turned back into nested models:
+#   "python"  - psycopg parses JSON into dicts, pydantic validates the dicts
+#   "json"    - psycopg keeps the raw bytes, pydantic-core validates them directly
+#   "trusted" - raw bytes are parsed and models built with `model_construct`,
+#               skipping validation; only for data this library wrote itself.
+#               Pays off for models with costly validators; for plain models
+#               pydantic-core's "json" path is usually as fast or faster.
+DecodeMode = Literal["python", "json", "trusted"]
+
+def _keep_raw(data: bytes) -> bytes:
+    return data
+
+class RawJsonbLoader(JsonbLoader):
+    """
+    Load `jsonb` (text format) as the undecoded JSON bytes.
+    """
+    _loads = staticmethod(_keep_raw)
+
+class RawJsonbBinaryLoader(JsonbBinaryLoader):
+    """
+    Load `jsonb` (binary format) as the undecoded JSON bytes.
+    """
+    _loads = staticmethod(_keep_raw)
+
+RAW_JSONB_LOADERS: list[tuple[str, type[Loader]]] = [
+    ("jsonb", RawJsonbLoader),
+    ("jsonb", RawJsonbBinaryLoader),
+]
+
+def loaders_for(decode: DecodeMode) -> list[tuple[str, type[Loader]]] | None:
+    return None if decode == "python" else RAW_JSONB_LOADERS
+
+def construct_trusted(annotation: Any, data: Any) -> Any:
+    """
+    Build `annotation` from already-parsed JSON without validation,
+    recursing into nested models, lists, dicts and optionals
+    (`model_construct` alone leaves nested models as dicts).
+    """
+    build = _builder(annotation)
+    return data if build is None or data is None else build(data)
+
+@lru_cache(maxsize=None)
+def _builder(annotation: Any) -> Callable[[Any], Any] | None:
+    """
+    Compile a constructor for `annotation` once; None means "use the value as is".
+    """
+    origin = get_origin(annotation)
+    args = get_args(annotation)
+
+    if origin in (Union, types.UnionType):
+        non_none = [a for a in args if a is not type(None)]
+        return _builder(non_none[0]) if non_none else None
+
+    if origin in (list, set, tuple) and args:
+        item = _builder(args[0])
+        if item is None:
+            return None
+        return lambda data: [None if v is None else item(v) for v in data] if isinstance(data, list) else data
+
+    if origin is dict and len(args) == 2:
+        value = _builder(args[1])
+        if value is None:
+            return None
+        return lambda data: {k: None if v is None else value(v) for k, v in data.items()} if isinstance(data, dict) else data
+
+    if issubclass_safe(annotation, BaseModel):
+        return _model_builder(annotation)
+
+    return None
+
+def _model_builder(model_cls: type[BaseModel]) -> Callable[[Any], Any]:
+    plan = [(name, _builder(field.annotation)) for name, field in model_cls.model_fields.items()]
+    # defaults and private attributes need pydantic's own setup
+    simple = not model_cls.__private_attributes__
+
+    def build(data):
+        if not isinstance(data, dict):
+            return data
+
+        values = {}
+        for name, field_builder in plan:
+            if name in data:
+                v = data[name]
+                values[name] = v if field_builder is None or v is None else field_builder(v)
+
+        if simple and len(values) == len(plan):
+            return _construct_complete(model_cls, values)
+        return model_cls.model_construct(_fields_set=set(values), **values)
+
+    return build
+
+def _construct_complete(model_cls: type[BaseModel], values: dict[str, Any]) -> BaseModel:
+    # What `model_construct` does for a model whose every field is present
+    # and which has no private attributes, minus its per-field default handling.
+    m = model_cls.__new__(model_cls)
+    object.__setattr__(m, "__dict__", values)
+    object.__setattr__(m, "__pydantic_fields_set__", set(values))
+    object.__setattr__(m, "__pydantic_extra__", None)
+    object.__setattr__(m, "__pydantic_private__", None)
+    return m
@@ -1,7 +1,14 @@
-from typing import get_origin, get_args
+import types
+from typing import ClassVar, Union, get_origin, get_args
 from pydantic import BaseModel
+from pydantic.fields import ModelPrivateAttr
 from pydantic._internal._model_construction import ModelMetaclass
 
+# Table-level flags a row model may declare, either as a ClassVar
+# (`create_uid: ClassVar[bool] = True`) or as a private attribute
+# (`_create_uid: bool = PrivateAttr(default=True)`).
+METADATA_KEYS = ("create_uid", "create_io_rel")
+
 def issubclass_safe(a, b):
     try:
         return issubclass(a, b)
@@ -24,7 +31,7 @@ def extract_pydantic_type(annotation):
     args = get_args(annotation)
 
     # Case 2: Optional[T] or T | None
-    if origin is None and args:
+    if origin in (Union, types.UnionType):
         # e.g. Union[T, None]
         for arg in args:
             if issubclass_safe(arg, BaseModel):
@@ -52,6 +59,10 @@ class PydanticTypeModelMeta(ModelMetaclass):
         pydantic_fields = {}
 
         for field_name, annotation in annotations.items():
+            # private attributes and class vars are not columns
+            if field_name.startswith("_") or get_origin(annotation) is ClassVar:
+                continue
+
             model_type = extract_pydantic_type(annotation)
 
             if model_type is not None:
@@ -59,11 +70,13 @@ class PydanticTypeModelMeta(ModelMetaclass):
             else:
                 sql_fields[field_name] = annotation
 
-        metadata = {
-            k: namespace[k]
-            for k in ("create_uid", "create_io_rel")
-            if k in namespace
-        }
+        metadata = {}
+        for k in METADATA_KEYS:
+            for attr in (k, f"_{k}"):
+                if attr in namespace:
+                    value = namespace[attr]
+                    metadata[k] = value.default if isinstance(value, ModelPrivateAttr) else value
+                    break
 
         namespace["_model_registry"] = {
             "name": name,
@@ -30,4 +30,22 @@ def insert_query(table : str, field_names : Composed, values : List[Any]) -> Com
         field_names,#.join(", ").as_string(conn),
         sql.SQL(', ').join(values)
     )
-    return query
\ No newline at end of file
+    return query
+
+def reserve_ids_query(table: str) -> Composed:
+    """
+    Draw `%(n)s` values from the table's `id` sequence so rows written
+    through COPY (which cannot RETURNING) know their ids up front.
+    """
+    query = sql.SQL("SELECT nextval(pg_get_serial_sequence({}, 'id')) FROM generate_series(1, {})").format(
+        sql.Literal(sql.Identifier(table).as_string(None)),
+        sql.Placeholder("n"),
+    )
+    return query
+
+def copy_in_query(table: str, columns: List[str]) -> Composed:
+    query = sql.SQL("COPY {} ({}) FROM STDIN (FORMAT BINARY)").format(
+        sql.Identifier(table),
+        sql.SQL(", ").join(sql.Identifier(c) for c in columns),
+    )
+    return query
@@ -1,33 +1,35 @@
 from psycopg import sql
-from pygres.schema.introspection import columns_from_model
+from pygres.schema.introspection import ColumnSpec, columns_from_model
 from typing_extensions import LiteralString
 from typing import Type, cast
 from pygres.types import ModelT
 
-def create_table_ddl(table_name: str, model_cls: Type[ModelT]) -> sql.Composed:
-    cols = columns_from_model(model_cls)
+def column_def(col: ColumnSpec) -> sql.Composed:
+    col_ident = sql.Identifier(col["name"])
 
-    column_defs: list[sql.Composed] = []
-    pk_cols: list[str] = []
+    pg_type = col["pg_type"]
+    # pg_type is from our own mapping, not user input
+    pg_type_lit = cast(LiteralString, pg_type)
+    col_type = sql.SQL(pg_type_lit)
 
-    for col in cols:
-        col_ident = sql.Identifier(col["name"])
+    col_def = sql.SQL("{} {}").format(col_ident, col_type)
 
-        pg_type = col["pg_type"]
-        # pg_type is from our own mapping, not user input
-        pg_type_lit = cast(LiteralString, pg_type)
-        col_type = sql.SQL(pg_type_lit)
+    if not col["nullable"]:
+        col_def += sql.SQL(" NOT NULL")
+    
+    if col["name"] == "created_at":
+        col_def += sql.SQL(" DEFAULT now()")
 
-        col_def = sql.SQL("{} {}").format(col_ident, col_type)
+    return col_def
 
-        if not col["nullable"]:
-            col_def += sql.SQL(" NOT NULL")
-        
-        if col["name"] == "created_at":
-            col_def += sql.SQL(" DEFAULT now()")
+def create_table_ddl(table_name: str, model_cls: Type[ModelT]) -> sql.Composed:
+    cols = columns_from_model(model_cls)
 
+    column_defs: list[sql.Composed] = []
+    pk_cols: list[str] = []
 
-        column_defs.append(col_def)
+    for col in cols:
+        column_defs.append(column_def(col))
 
         if col["is_pk"]:
             pk_cols.append(col["name"])
@@ -46,7 +48,37 @@ def create_table_ddl(table_name: str, model_cls: Type[ModelT]) -> sql.Composed:
 
     return ddl
 
-def io_relationship_ddl(table_name: str | sql.Identifier, model_cls: Type[ModelT]) -> sql.Composed | None:
+def migrate_columns_ddl(table_name: str, model_cls: Type[ModelT]) -> list[sql.Composed]:
+    """
+    Bring a table created from an older definition of `model_cls` up to date:
+    add the columns it lacks and drop NOT NULL from columns the model no longer
+    declares (so inserts that omit them keep working). Nothing is dropped or
+    retyped, and a no-op on a freshly created table.
+    """
+    cols = [c for c in columns_from_model(model_cls) if not c["is_pk"]]
+    table_ident = sql.Identifier(table_name)
+
+    add_columns = sql.SQL("ALTER TABLE {} {}").format(
+        table_ident,
+        sql.SQL(", ").join(sql.SQL("ADD COLUMN IF NOT EXISTS {}").format(column_def(c)) for c in cols),
+    )
+
+    known = sql.SQL(", ").join(sql.Literal(name) for name in ["id", *(c["name"] for c in cols)])
+    relax_leftovers = sql.SQL(
+        "DO $$ DECLARE col text; BEGIN "
+        "FOR col IN SELECT attname FROM pg_attribute WHERE attrelid = {}::regclass "
+        "AND attnum > 0 AND NOT attisdropped AND attnotnull AND attname <> ALL (ARRAY[{}]) LOOP "
+        "EXECUTE 'ALTER TABLE ' || {} || ' ALTER COLUMN ' || quote_ident(col) || ' DROP NOT NULL'; "
+        "END LOOP; END $$"
+    ).format(
+        sql.Literal(table_ident.as_string(None)),
+        known,
+        sql.Literal(table_ident.as_string(None)),
+    )
+
+    return [add_columns, relax_leftovers]
+
+def io_relationship_ddl(table_name: str, model_cls: Type[ModelT]) -> sql.Composed | None:
     """
     Generate DDL for a self-referential foreign key on `input_id` → `id`
     (used for "input/output" tree-like relationships, e.g., in pipelines or IO chains).
@@ -59,14 +91,14 @@ def io_relationship_ddl(table_name: str | sql.Identifier, model_cls: Type[ModelT
     if not metadata.get("create_io_rel"):
         return None
 
-    # Ensure table_name is an Identifier
-    table_ident = sql.Identifier(table_name) if isinstance(table_name, str) else table_name
+    table_ident = sql.Identifier(table_name)
 
     # Constraint name: e.g. "mytable_input_fk"
-    constraint_name = sql.Identifier(f"{table_name}_input_fk" if isinstance(table_name, str) else f"{table_name.as_string}_input_fk")
+    constraint_name = sql.Identifier(f"{table_name}_input_fk")
 
     # Build: ALTER TABLE "mytable" ADD CONSTRAINT "mytable_input_fk" FOREIGN KEY (input_id) REFERENCES "mytable" (id)
-    ddl = sql.SQL("ALTER TABLE {} ADD CONSTRAINT {} FOREIGN KEY ({}) REFERENCES {} ({})").format(
+    # NOT VALID: enforced for new writes, without failing on rows written before the key existed
+    alter = sql.SQL("ALTER TABLE {} ADD CONSTRAINT {} FOREIGN KEY ({}) REFERENCES {} ({}) NOT VALID").format(
         table_ident,
         constraint_name,
         sql.Identifier("input_id"),
@@ -74,4 +106,22 @@ def io_relationship_ddl(table_name: str | sql.Identifier, model_cls: Type[ModelT
         sql.Identifier("id"),
     )
 
-    return ddl
\ No newline at end of file
+    # ADD CONSTRAINT has no IF NOT EXISTS; swallow the duplicate instead
+    ddl = sql.SQL("DO $$ BEGIN {}; EXCEPTION WHEN duplicate_object THEN NULL; END $$").format(alter)
+
+    return ddl
+
+def table_name_for(model_cls: Type[ModelT]) -> str:
+    return model_cls.__name__.lower()
+
+def schema_ddl(table_name: str, model_cls: Type[ModelT]) -> list[sql.Composed]:
+    """
+    Every statement needed to create `table_name` for `model_cls`; each is idempotent.
+    """
+    statements = [create_table_ddl(table_name, model_cls), *migrate_columns_ddl(table_name, model_cls)]
+
+    rel = io_relationship_ddl(table_name, model_cls)
+    if rel:
+        statements.append(rel)
+
+    return statements
@@ -0,0 +1,150 @@
+import hashlib
+import json
+import weakref
+from psycopg import sql
+from pygres.schema.ddl import schema_ddl, table_name_for
+from pygres.schema.introspection import columns_from_model
+from typing import Any, Iterable, Type
+from pygres.types import ModelT
+
+# Server-side record of the schema each table was last created with
+REGISTRY_TABLE = "pygres_schema"
+
+# Serializes concurrent bootstraps (arbitrary constant, "pygres" in ASCII)
+_BOOTSTRAP_LOCK_KEY = 0x707967726573
+
+# Per-Database cache of {table name: fingerprint} already known to be applied,
+# so table objects created later in the same process need no round trip at all.
+# It is never re-validated: after dropping or altering a table behind the
+# library's back, call `forget_schema()` so the next table object checks again.
+_applied: "weakref.WeakKeyDictionary[Any, dict[str, str]]" = weakref.WeakKeyDictionary()
+
+def schema_fingerprint(model_cls: Type[ModelT]) -> str:
+    """
+    Hash of everything the DDL is generated from: column specs and table metadata.
+    """
+    reg = model_cls.schema_info()
+    payload = {
+        "columns": columns_from_model(model_cls),
+        "metadata": reg["metadata"],
+    }
+    encoded = json.dumps(payload, sort_keys=True, default=_encode_default)
+    return hashlib.sha256(encoded.encode()).hexdigest()
+
+def _encode_default(value: Any) -> Any:
+    if hasattr(value, "model_dump"):
+        return value.model_dump(mode="json")
+    return repr(value)
+
+def _registry_exists_query() -> sql.Composed:
+    # never fails, unlike selecting from a table that may not exist yet
+    # (which would abort an enclosing transaction)
+    return sql.SQL("SELECT to_regclass({}) IS NOT NULL").format(
+        sql.Literal(sql.Identifier(REGISTRY_TABLE).as_string(None))
+    )
+
+def _registry_query() -> sql.Composed:
+    # tables dropped behind our back count as missing, whatever the registry says
+    return sql.SQL(
+        "SELECT table_name, fingerprint FROM {} "
+        "WHERE table_name = ANY(%(names)s) AND to_regclass(quote_ident(table_name)) IS NOT NULL"
+    ).format(sql.Identifier(REGISTRY_TABLE))
+
+def _bootstrap_script(stale: list[tuple[str, Type[ModelT], str]]) -> sql.Composed:
+    """
+    One multi-statement script (a single round trip, one implicit transaction)
+    creating the registry, every stale table, and recording their fingerprints.
+    """
+    registry = sql.Identifier(REGISTRY_TABLE)
+    statements: list[sql.Composable] = [
+        sql.SQL("SELECT pg_advisory_xact_lock({})").format(sql.Literal(_BOOTSTRAP_LOCK_KEY)),
+        sql.SQL(
+            "CREATE TABLE IF NOT EXISTS {} ("
+            "table_name TEXT PRIMARY KEY, fingerprint TEXT NOT NULL, "
+            "applied_at TIMESTAMPTZ NOT NULL DEFAULT now())"
+        ).format(registry),
+    ]
+
+    for table_name, model_cls, _ in stale:
+        statements.extend(schema_ddl(table_name, model_cls))
+
+    values = sql.SQL(", ").join(
+        sql.SQL("({}, {})").format(sql.Literal(name), sql.Literal(fp)) for name, _, fp in stale
+    )
+    statements.append(sql.SQL(
+        "INSERT INTO {} (table_name, fingerprint) VALUES {} "
+        "ON CONFLICT (table_name) DO UPDATE SET fingerprint = EXCLUDED.fingerprint, applied_at = now()"
+    ).format(registry, values))
+
+    return sql.SQL("; ").join(statements)
+
+def _plan(db, models: Iterable[Type[ModelT]]) -> list[tuple[str, Type[ModelT], str]]:
+    known = _applied.get(db, {})
+    wanted = [(table_name_for(m), m, schema_fingerprint(m)) for m in models]
+    return [(name, m, fp) for name, m, fp in wanted if known.get(name) != fp]
+
+def _stale(pending: list[tuple[str, Type[ModelT], str]], recorded: Iterable[tuple[str, str]]):
+    current = dict(recorded)
+    return [(name, m, fp) for name, m, fp in pending if current.get(name) != fp]
+
+def _mark_applied(db, tables: list[tuple[str, Type[ModelT], str]]):
+    _applied.setdefault(db, {}).update({name: fp for name, _, fp in tables})
+
+def forget_schema(db, *models: Type[ModelT]):
+    """
+    Drop the process cache for `models` (all tables if none are given),
+    so the next `ensure_schema` checks the registry again.
+    """
+    known = _applied.get(db)
+    if known is None:
+        return
+    if not models:
+        known.clear()
+    for m in models:
+        known.pop(table_name_for(m), None)
+
+def ensure_schema(db, *models: Type[ModelT]) -> list[str]:
+    """
+    Create the tables for `models` unless the registry already records their
+    current fingerprint. Costs nothing for tables this process already checked,
+    two small queries when everything is up to date, and one more round trip
+    to apply all stale DDL in a single batch. Returns the names of the tables (re)applied.
+
+    Runs through `db.detached()`, so it is safe inside `transaction()` /
+    `pipeline()`; fingerprints are cached only once the DDL has committed.
+    DDL is additive (IF NOT EXISTS); a changed column spec is not migrated.
+    """
+    pending = _plan(db, models)
+    if not pending:
+        return []
+
+    with db.detached() as ddb:
+        recorded = []
+        if ddb.fetch_val(_registry_exists_query()):
+            recorded = ddb.fetch_all(_registry_query(), {"names": [name for name, _, _ in pending]})
+
+        stale = _stale(pending, recorded)
+        if stale:
+            ddb.execute(_bootstrap_script(stale))
+
+    _mark_applied(db, pending)
+    return [name for name, _, _ in stale]
+
+async def ensure_schema_async(db, *models: Type[ModelT]) -> list[str]:
+    """
+    `ensure_schema` for an `AsyncDatabase` (which has no transaction scopes).
+    """
+    pending = _plan(db, models)
+    if not pending:
+        return []
+
+    recorded = []
+    if await db.fetch_val(_registry_exists_query()):
+        recorded = await db.fetch_all(_registry_query(), {"names": [name for name, _, _ in pending]})
+
+    stale = _stale(pending, recorded)
+    if stale:
+        await db.execute(_bootstrap_script(stale))
+
+    _mark_applied(db, pending)
+    return [name for name, _, _ in stale]
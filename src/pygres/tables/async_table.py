@@ -0,0 +1,88 @@
+import asyncio
+from pygres.db.async_database import AsyncDatabase
+from pygres.models.codec import DecodeMode
+from pygres.schema.registry import ensure_schema_async
+from pygres.tables.base import TableBase
+from psycopg import sql
+from typing import Any, AsyncIterator, Iterable, Type
+from pygres.types import ModelT
+
+class AsyncPydanticTypeTable(TableBase[ModelT]):
+    """
+    asyncio counterpart of `PydanticTypeTable`.
+
+    DDL cannot run from `__init__`, so the schema is created on first use
+    (or explicitly with `await table.create_schema()`).
+    """
+    def __init__(self, db: AsyncDatabase, model_cls: Type[ModelT], decode: DecodeMode | None = None):
+        super().__init__(model_cls, decode)
+        self.db = db
+        self._schema_ready = False
+        self._schema_lock = asyncio.Lock()
+
+    async def create_schema(self):
+        if self._schema_ready:
+            return
+
+        async with self._schema_lock:
+            if not self._schema_ready:
+                await ensure_schema_async(self.db, self.model_cls)
+                self._schema_ready = True
+
+    async def add(self, instance: ModelT) -> ModelT:
+        await self.create_schema()
+        row = instance.to_db_row()
+
+        new_id = await self.db.fetch_val(self.statements.insert, row, prepare=True)
+        instance.id = new_id
+        return instance
+
+    async def add_many(self, instances: Iterable[ModelT], chunk_size: int = 1000) -> int:
+        """
+        Bulk insert through binary COPY; see `PydanticTypeTable.add_many`.
+        """
+        await self.create_schema()
+        total = 0
+
+        for chunk in self._chunks(instances, chunk_size):
+            copy_sql, types, db_rows = self._copy_plan(chunk)
+            reserved = await self.db.fetch_all(self.statements.reserve_ids, {"n": len(chunk)}, prepare=True)
+            ids = [r[0] for r in reserved]
+
+            await self.db.copy_rows(copy_sql, self._copy_values(ids, db_rows), types)
+
+            for instance, new_id in zip(chunk, ids):
+                instance.id = new_id
+            total += len(chunk)
+
+        return total
+
+    async def get(self, id: int) -> ModelT | None:
+        await self.create_schema()
+        values = await self.db.fetch_one(
+            self.statements.select_by_id, {"id": id}, prepare=True, loaders=self.loaders
+        )
+        return self._from_values(values) if values else None
+
+    async def iter_rows(
+        self,
+        where: str | sql.Composable | None = None,
+        params: dict[str, Any] | None = None,
+        batch_size: int = 1000,
+    ) -> AsyncIterator[ModelT]:
+        """
+        Lazily yield rows through a server-side cursor; see `PydanticTypeTable.iter_rows`.
+        """
+        await self.create_schema()
+        query = self._select_sql(where)
+        async for values in self.db.stream(query, params, batch_size, self.loaders):
+            yield self._from_values(values)
+
+    async def update(self, instance: ModelT) -> bool:
+        """
+        Write every column of `instance` back to its row; returns False if no row has its id.
+        """
+        await self.create_schema()
+        params = self._update_params(instance)
+        updated = await self.db.execute(self.statements.update_by_id, params, prepare=True)
+        return updated == 1
@@ -0,0 +1,141 @@
+from itertools import islice
+from psycopg import sql
+from pygres.models.codec import DecodeMode, loaders_for
+from pygres.query.builder import copy_in_query, reserve_ids_query
+from pygres.schema.ddl import table_name_for
+from pygres.schema.introspection import columns_from_model
+from typing import Any, Generic, Iterable, Iterator, NamedTuple, Sequence, Type
+from pygres.types import ModelT
+
+class TableStatements(NamedTuple):
+    insert: bytes
+    select_by_id: bytes
+    update_by_id: bytes
+    reserve_ids: bytes
+
+class TableBase(Generic[ModelT]):
+    """
+    SQL generation shared by the sync and async table wrappers.
+    Holds no connection; subclasses decide how statements are executed.
+    """
+    # how JSONB columns are decoded on read; see `pygres.models.codec.DecodeMode`
+    decode: DecodeMode = "python"
+
+    def __init__(self, model_cls: Type[ModelT], decode: DecodeMode | None = None):
+        self.model_cls = model_cls
+        if decode is not None:
+            self.decode = decode
+
+        table_name = table_name_for(model_cls)
+        self.table_name = table_name
+        self.table_name_ident = sql.Identifier(table_name)
+        self.columns = {col["name"]: col for col in columns_from_model(model_cls)}
+
+        reg = model_cls.schema_info()
+        # columns written from `to_db_row`, in its key order
+        self.write_columns = [*reg["pydantic_fields"], *reg["sql_fields"]]
+        # columns that map back onto model fields, in SELECT order
+        self.read_columns = ["id", *self.write_columns]
+
+        self.statements = self._compile_statements()
+
+    def _compile_statements(self) -> TableStatements:
+        """
+        Render the per-table statements once. They are kept as bytes so
+        psycopg neither re-composes nor re-parses them on every call, which
+        also lets them be executed as server-side prepared statements.
+        """
+        return TableStatements(
+            insert=self._insert_sql(self.write_columns).as_bytes(None),
+            select_by_id=self._select_by_id_sql().as_bytes(None),
+            update_by_id=self._update_by_id_sql(self.write_columns).as_bytes(None),
+            reserve_ids=reserve_ids_query(self.table_name).as_bytes(None),
+        )
+
+    def _insert_sql(self, columns: Sequence[str]) -> sql.Composed:
+        col_idents = [sql.Identifier(k) for k in columns]
+        placeholders = [sql.Placeholder(k) for k in columns]
+
+        return sql.SQL(
+            "INSERT INTO {} ({}) VALUES ({}) RETURNING id"
+        ).format(
+            self.table_name_ident,
+            sql.SQL(", ").join(col_idents),
+            sql.SQL(", ").join(placeholders),
+        )
+
+    def _select_by_id_sql(self) -> sql.Composed:
+        return sql.SQL("SELECT {} FROM {} WHERE {} = {}").format(
+            sql.SQL(", ").join(sql.Identifier(c) for c in self.read_columns),
+            self.table_name_ident,
+            sql.Identifier("id"),
+            sql.Placeholder("id"),
+        )
+
+    def _select_sql(self, where: str | sql.Composable | None = None) -> sql.Composed:
+        query = sql.SQL("SELECT {} FROM {}").format(
+            sql.SQL(", ").join(sql.Identifier(c) for c in self.read_columns),
+            self.table_name_ident,
+        )
+        if where is not None:
+            # raw strings are the caller's own SQL, as with Database.execute
+            cond = sql.SQL(where) if isinstance(where, str) else where # type: ignore[arg-type]
+            query += sql.SQL(" WHERE {}").format(cond)
+        return query
+
+    def _update_by_id_sql(self, columns: Sequence[str]) -> sql.Composed:
+        assignments = [
+            sql.SQL("{} = {}").format(sql.Identifier(k), sql.Placeholder(k))
+            for k in columns
+        ]
+
+        return sql.SQL("UPDATE {} SET {} WHERE {} = {}").format(
+            self.table_name_ident,
+            sql.SQL(", ").join(assignments),
+            sql.Identifier("id"),
+            sql.Placeholder("id"),
+        )
+
+    def _update_params(self, instance: ModelT) -> dict[str, Any]:
+        if instance.id is None:
+            raise ValueError(f"Cannot update {self.model_cls.__name__} without an id")
+
+        row = instance.to_db_row()
+        row["id"] = instance.id
+        return row
+
+    @property
+    def loaders(self):
+        # cursor loaders matching `decode` (raw JSONB bytes unless "python")
+        return loaders_for(self.decode)
+
+    def _from_values(self, values: Sequence[Any]) -> ModelT:
+        return self.model_cls.from_db_row(dict(zip(self.read_columns, values)), self.decode)
+
+    @staticmethod
+    def _chunks(instances: Iterable[ModelT], chunk_size: int) -> Iterator[list[ModelT]]:
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be >= 1")
+
+        it = iter(instances)
+        while chunk := list(islice(it, chunk_size)):
+            yield chunk
+
+    def _copy_plan(self, chunk: list[ModelT]) -> tuple[sql.Composed, list[str], list[dict[str, Any]]]:
+        """
+        Serialize a chunk for binary COPY: the statement, the column types
+        and one row dict per instance (without `id`, which is reserved separately).
+        """
+        db_rows = [instance.to_db_row() for instance in chunk]
+        columns = ["id", *db_rows[0].keys()]
+        types = [self._copy_type(name) for name in columns]
+        return copy_in_query(self.table_name, columns), types, db_rows
+
+    @staticmethod
+    def _copy_values(ids: list[int], db_rows: list[dict[str, Any]]) -> Iterator[list[Any]]:
+        return ([new_id, *row.values()] for new_id, row in zip(ids, db_rows))
+
+    def _copy_type(self, column: str) -> str:
+        pg_type = self.columns[column]["pg_type"]
+        # COPY needs the concrete type behind SERIAL
+        return "integer" if pg_type == "SERIAL" else pg_type.lower()
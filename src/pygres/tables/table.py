@@ -1,39 +1,79 @@
-from psycopg import sql
 from pygres.db.database import Database
 from pygres.models.base_model import PydanticTypeModel
-from pygres.schema.ddl import create_table_ddl, io_relationship_ddl
-from typing import Generic, Type
+from pygres.models.codec import DecodeMode
+from pygres.schema.registry import ensure_schema
+from pygres.tables.base import TableBase
+from psycopg import sql
+from typing import Any, Iterable, Iterator, Type
 from pygres.types import ModelT
 
-class PydanticTypeTable(Generic[ModelT]):
-    def __init__(self, db: Database, model_cls: Type[ModelT]):
+class PydanticTypeTable(TableBase[ModelT]):
+    def __init__(self, db: Database, model_cls: Type[ModelT], decode: DecodeMode | None = None):
+        super().__init__(model_cls, decode)
         self.db = db
-        self.model_cls = model_cls
-
-        table_name = model_cls.__name__.lower()
-        self.table_name_ident = sql.Identifier(table_name)
-
-        ddl = create_table_ddl(table_name, model_cls)
-        self.db.execute(ddl)
 
-        rel = io_relationship_ddl(table_name, model_cls)
-        if rel:
-            self.db.execute(rel)
+        ensure_schema(self.db, model_cls)
 
     def add(self, instance: ModelT) -> ModelT:
+        """
+        Insert one row. Inside `db.pipeline()` the id is assigned when the
+        pipeline syncs rather than on return.
+        """
         row = instance.to_db_row()
 
-        col_idents = [sql.Identifier(k) for k in row.keys()]
-        placeholders = [sql.Placeholder(k) for k in row.keys()]
+        def assign_id(new_id):
+            instance.id = new_id
+
+        self.db.submit_val(self.statements.insert, row, assign_id, prepare=True)
+        return instance
+
+    def add_many(self, instances: Iterable[ModelT], chunk_size: int = 1000) -> int:
+        """
+        Bulk insert through binary COPY, `chunk_size` rows at a time.
 
-        insert_sql = sql.SQL(
-            "INSERT INTO {} ({}) VALUES ({}) RETURNING id"
-        ).format(
-            self.table_name_ident,
-            sql.SQL(", ").join(col_idents),
-            sql.SQL(", ").join(placeholders),
+        Ids are drawn from the table's sequence before each chunk is copied
+        and assigned back to the instances once the chunk is written.
+        Returns the number of rows inserted.
+        """
+        total = 0
+
+        for chunk in self._chunks(instances, chunk_size):
+            copy_sql, types, db_rows = self._copy_plan(chunk)
+            reserved = self.db.fetch_all(self.statements.reserve_ids, {"n": len(chunk)}, prepare=True)
+            ids = [r[0] for r in reserved]
+
+            self.db.copy_rows(copy_sql, self._copy_values(ids, db_rows), types)
+
+            for instance, new_id in zip(chunk, ids):
+                instance.id = new_id
+            total += len(chunk)
+
+        return total
+
+    def get(self, id: int) -> ModelT | None:
+        values = self.db.fetch_one(
+            self.statements.select_by_id, {"id": id}, prepare=True, loaders=self.loaders
         )
+        return self._from_values(values) if values else None
 
-        new_id = self.db.fetch_val(insert_sql, row)
-        instance.id = new_id
-        return instance
+    def iter_rows(
+        self,
+        where: str | sql.Composable | None = None,
+        params: dict[str, Any] | None = None,
+        batch_size: int = 1000,
+    ) -> Iterator[ModelT]:
+        """
+        Lazily yield rows (optionally filtered by a `WHERE` condition with
+        `params`) through a server-side cursor, `batch_size` rows per fetch.
+        """
+        query = self._select_sql(where)
+        for values in self.db.stream(query, params, batch_size, self.loaders):
+            yield self._from_values(values)
+
+    def update(self, instance: ModelT) -> bool:
+        """
+        Write every column of `instance` back to its row; returns False if no row has its id.
+        """
+        params = self._update_params(instance)
+        updated = self.db.execute(self.statements.update_by_id, params, prepare=True)
+        return updated == 1
@@ -1,3 +1,6 @@
+from contextlib import contextmanager
+from psycopg import sql as pg_sql
+
 class FakeDB:
     """
     A fake DB adapter that captures SQL and parameters.
@@ -5,12 +8,56 @@ class FakeDB:
     def __init__(self):
         self.last_sql = None
         self.last_params = None
+        self.last_prepare = None
+        # rows handed back by stream(), as tuples in TableBase.read_columns order
+        self.stream_rows = []
+        # every statement seen, in order
+        self.calls = []
+        # rows handed back by fetch_all() for anything but an id reservation
+        self.fetch_all_rows = []
 
-    def execute(self, sql, params=None):
-        self.last_sql = sql
+    def _capture(self, sql, params, prepare=None):
+        # pre-rendered table statements arrive as bytes; keep them inspectable
+        self.last_sql = pg_sql.SQL(sql.decode()) if isinstance(sql, bytes) else sql
         self.last_params = params
+        self.last_prepare = prepare
+        self.calls.append(self.last_sql)
 
-    def fetch_val(self, sql, params=None):
-        self.last_sql = sql
-        self.last_params = params
+    def execute(self, sql, params=None, prepare=None):
+        self._capture(sql, params, prepare)
+        return 1
+
+    def fetch_val(self, sql, params=None, prepare=None):
+        self._capture(sql, params, prepare)
         return 42  # pretend DB assigned ID 42
+
+    def submit_val(self, sql, params, callback, prepare=None):
+        callback(self.fetch_val(sql, params, prepare))
+
+    def fetch_all(self, sql, params=None, prepare=None):
+        self._capture(sql, params, prepare)
+        if "n" in (params or {}):
+            # pretend DB handed out a run of sequence values starting at 42
+            return [(42 + i,) for i in range(params["n"])] # type: ignore[index]
+        return self.fetch_all_rows
+
+    def fetch_one(self, sql, params=None, prepare=None, loaders=None):
+        self._capture(sql, params, prepare)
+        self.last_loaders = loaders
+        return self.stream_rows[0] if self.stream_rows else None
+
+    def stream(self, sql, params=None, batch_size=1000, loaders=None):
+        self._capture(sql, params)
+        self.last_batch_size = batch_size
+        self.last_loaders = loaders
+        yield from self.stream_rows
+
+    @contextmanager
+    def detached(self):
+        yield self
+
+    def copy_rows(self, sql, rows, types=None):
+        self._capture(sql, None)
+        self.copied_rows = list(rows)
+        self.copied_types = types
+        return len(self.copied_rows)
@@ -1,6 +1,8 @@
-from pygres.db.database import Database
+from concurrent.futures import ThreadPoolExecutor
+from pygres.db.database import Database, PoolConfig
 from pygres.examples.eg import AnalysisRow, AnalysisTable
 from pygres.examples.models import AnalysisRequest, VirtualFile
+from pygres.schema.registry import ensure_schema, forget_schema, schema_fingerprint
 from pygres.tests.config.internal_config import config
 def test_analysis_round_trip_postgres():
     # Connect to your test DB
@@ -51,4 +53,215 @@ def test_analysis_round_trip_postgres():
     assert reconstructed.input.files is not None
 
     # Nested model value from Pydantic Model -> field -> Pydantic Model -> Field
-    assert reconstructed.input.files[0].content == "class Foo {}"
\ No newline at end of file
+    assert reconstructed.input.files[0].content == "class Foo {}"
+
+def test_analysis_add_many_postgres():
+    db = Database(
+        host="localhost",
+        port=5432,
+        dbname="testdb",
+        user="postgres",
+        password=config.DB_PW
+    )
+    db.execute("DROP TABLE IF EXISTS analysisrow CASCADE")
+    table = AnalysisTable(db)
+
+    rows = (
+        AnalysisRow(input=AnalysisRequest(files=[VirtualFile(content=f"class C{i} {{}}")]))
+        for i in range(25)
+    )
+    saved = []
+    inserted = table.add_many((saved.append(r) or r for r in rows), chunk_size=10)
+
+    assert inserted == 25
+    assert len({r.id for r in saved}) == 25
+
+    result = db.fetch_one("SELECT input FROM analysisrow WHERE id = %(id)s", {"id": saved[7].id})
+    assert result is not None
+    assert result[0]["files"][0]["content"] == "class C7 {}"
+
+    loaded = table.get(saved[7].id) # type: ignore[arg-type]
+    assert loaded is not None
+    assert loaded.input.files[0].content == "class C7 {}" # type: ignore[index]
+
+    loaded.input.files[0].content = "class D7 {}" # type: ignore[index]
+    assert table.update(loaded)
+    assert table.get(saved[7].id).input.files[0].content == "class D7 {}" # type: ignore
+
+
+def test_analysis_pooled_threads_postgres():
+    db = Database(
+        pool=PoolConfig(min_size=1, max_size=4),
+        host="localhost",
+        port=5432,
+        dbname="testdb",
+        user="postgres",
+        password=config.DB_PW
+    )
+    db.execute("DROP TABLE IF EXISTS analysisrow CASCADE")
+    table = AnalysisTable(db)
+
+    def work(i: int) -> int | None:
+        row = AnalysisRow(input=AnalysisRequest(files=[VirtualFile(content=f"class T{i} {{}}")]))
+        return table.add(row).id
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        ids = list(pool.map(work, range(40)))
+
+    assert len(set(ids)) == 40
+    assert db.fetch_val("SELECT count(*) FROM analysisrow") == 40
+    db.close()
+
+
+def test_analysis_transaction_and_pipeline_postgres():
+    db = Database(
+        host="localhost",
+        port=5432,
+        dbname="testdb",
+        user="postgres",
+        password=config.DB_PW
+    )
+    db.execute("DROP TABLE IF EXISTS analysisrow CASCADE")
+    table = AnalysisTable(db)
+
+    # One commit for the whole block; an error rolls every add() back
+    try:
+        with db.transaction():
+            table.add(AnalysisRow(input=AnalysisRequest()))
+            table.add(AnalysisRow(input=AnalysisRequest()))
+            raise RuntimeError("abort")
+    except RuntimeError:
+        pass
+    assert db.fetch_val("SELECT count(*) FROM analysisrow") == 0
+
+    # Pipelined adds get their ids once the block syncs
+    rows = [AnalysisRow(input=AnalysisRequest(files=[VirtualFile(content=f"p{i}")])) for i in range(50)]
+    with db.pipeline():
+        for r in rows:
+            table.add(r)
+    assert all(r.id is not None for r in rows)
+    assert len({r.id for r in rows}) == 50
+
+    loaded = table.get(rows[-1].id) # type: ignore[arg-type]
+    assert loaded is not None
+    assert loaded.input.files[0].content == "p49" # type: ignore[index]
+
+
+def test_analysis_iter_rows_postgres():
+    db = Database(
+        host="localhost",
+        port=5432,
+        dbname="testdb",
+        user="postgres",
+        password=config.DB_PW
+    )
+    db.execute("DROP TABLE IF EXISTS analysisrow CASCADE")
+    table = AnalysisTable(db)
+
+    # input_id references another row, so roots go in first
+    roots = [AnalysisRow(input=AnalysisRequest()) for _ in range(3)]
+    table.add_many(roots)
+    table.add_many(
+        AnalysisRow(input=AnalysisRequest(files=[VirtualFile(content=f"s{i}")]), input_id=roots[i % 3].id)
+        for i in range(99)
+    )
+
+    scanned = list(table.iter_rows(batch_size=7))
+    assert len(scanned) == 102
+    assert all(isinstance(r, AnalysisRow) for r in scanned)
+
+    k = roots[1].id
+    filtered = list(table.iter_rows(where="input_id = %(k)s", params={"k": k}, batch_size=10))
+    assert len(filtered) == 33
+    assert all(r.input_id == k for r in filtered)
+
+    # Abandoning the iterator early releases the cursor and connection
+    it = table.iter_rows(batch_size=5)
+    next(it)
+    it.close()
+    assert db.fetch_val("SELECT count(*) FROM analysisrow") == 102
+
+
+def test_analysis_raw_jsonb_decode_postgres():
+    db = Database(
+        host="localhost",
+        port=5432,
+        dbname="testdb",
+        user="postgres",
+        password=config.DB_PW
+    )
+    db.execute("DROP TABLE IF EXISTS analysisrow CASCADE")
+    table = AnalysisTable(db)
+    saved = table.add(AnalysisRow(input=AnalysisRequest(files=[VirtualFile(content="class Foo {}")])))
+
+    for decode in ("json", "trusted"):
+        table.decode = decode # type: ignore[assignment]
+        loaded = table.get(saved.id) # type: ignore[arg-type]
+        assert loaded is not None
+        assert isinstance(loaded.input.files[0], VirtualFile) # type: ignore[index]
+        assert loaded.input.files[0].content == "class Foo {}" # type: ignore[index]
+        assert [r.id for r in table.iter_rows()] == [saved.id]
+
+
+def test_analysis_schema_registry_postgres():
+    db = Database(
+        host="localhost",
+        port=5432,
+        dbname="testdb",
+        user="postgres",
+        password=config.DB_PW
+    )
+    db.execute("DROP TABLE IF EXISTS analysisrow CASCADE")
+    db.execute("DROP TABLE IF EXISTS pygres_schema")
+
+    # Bootstrapping from inside a transaction runs on its own connection,
+    # so a rollback of the block does not undo (or break) the DDL
+    try:
+        with db.transaction():
+            table = AnalysisTable(db)
+            table.add(AnalysisRow(input=AnalysisRequest()))
+            raise RuntimeError("abort")
+    except RuntimeError:
+        pass
+    assert db.fetch_val("SELECT count(*) FROM analysisrow") == 0
+    assert db.fetch_val(
+        "SELECT fingerprint FROM pygres_schema WHERE table_name = 'analysisrow'"
+    ) == schema_fingerprint(AnalysisRow)
+
+    # Up to date: nothing re-applied, even from inside a pipeline
+    forget_schema(db)
+    with db.pipeline():
+        assert ensure_schema(db, AnalysisRow) == []
+        table.add(AnalysisRow(input=AnalysisRequest()))
+    assert db.fetch_val("SELECT count(*) FROM analysisrow") == 1
+
+    # A dropped table is recreated once the process cache is invalidated
+    db.execute("DROP TABLE analysisrow")
+    assert ensure_schema(db, AnalysisRow) == []
+    forget_schema(db, AnalysisRow)
+    assert ensure_schema(db, AnalysisRow) == ["analysisrow"]
+    assert db.fetch_val("SELECT count(*) FROM analysisrow") == 0
+
+
+def test_analysis_legacy_table_is_migrated_postgres():
+    db = Database(
+        host="localhost",
+        port=5432,
+        dbname="testdb",
+        user="postgres",
+        password=config.DB_PW
+    )
+    db.execute("DROP TABLE IF EXISTS analysisrow CASCADE")
+    # as created before private attributes stopped being columns
+    db.execute(
+        'CREATE TABLE analysisrow (id SERIAL PRIMARY KEY, input JSONB, output JSONB, input_id INTEGER, '
+        '"_create_uid" BOOLEAN NOT NULL, "_create_io_rel" BOOLEAN NOT NULL)'
+    )
+    db.execute("""INSERT INTO analysisrow (input, input_id, "_create_uid", "_create_io_rel") VALUES ('{}', 0, true, true)""")
+
+    table = AnalysisTable(db)
+    saved = table.add(AnalysisRow(input=AnalysisRequest()))
+    child = table.add(AnalysisRow(input=AnalysisRequest(), input_id=saved.id))
+
+    assert table.get(child.id).input_id == saved.id # type: ignore
+    assert db.fetch_val("SELECT count(*) FROM analysisrow WHERE created_at IS NOT NULL") == 3
@@ -0,0 +1,61 @@
+import asyncio
+from pygres.db.async_database import AsyncDatabase
+from pygres.db.database import PoolConfig
+from pygres.examples.eg import AnalysisRow, AsyncAnalysisTable
+from pygres.examples.models import AnalysisRequest, VirtualFile
+from pygres.tests.config.internal_config import config
+
+async def _connect(pool: PoolConfig | None = None) -> AsyncDatabase:
+    return await AsyncDatabase.connect(
+        pool=pool,
+        host="localhost",
+        port=5432,
+        dbname="testdb",
+        user="postgres",
+        password=config.DB_PW
+    )
+
+def test_async_analysis_round_trip_postgres():
+    async def run():
+        db = await _connect()
+        await db.execute("DROP TABLE IF EXISTS analysisrow CASCADE")
+        table = AsyncAnalysisTable(db)
+
+        req = AnalysisRequest(files=[VirtualFile(content="class Foo {}", language="cs")])
+        saved = await table.add(AnalysisRow(input=req))
+        assert saved.id is not None
+
+        loaded = await table.get(saved.id)
+        assert loaded is not None
+        assert loaded.input.files is not None
+        assert loaded.input.files[0].content == "class Foo {}"
+
+        assert await table.get(-1) is None
+
+        streamed = [r async for r in table.iter_rows(where="id = %(id)s", params={"id": saved.id})]
+        assert [r.id for r in streamed] == [saved.id]
+        await db.close()
+
+    asyncio.run(run())
+
+def test_async_analysis_add_many_pooled_postgres():
+    async def run():
+        db = await _connect(PoolConfig(min_size=1, max_size=4))
+        await db.execute("DROP TABLE IF EXISTS analysisrow CASCADE")
+        table = AsyncAnalysisTable(db)
+
+        rows = [
+            AnalysisRow(input=AnalysisRequest(files=[VirtualFile(content=f"class A{i} {{}}")]))
+            for i in range(30)
+        ]
+        assert await table.add_many(rows, chunk_size=7) == 30
+
+        # concurrent single-row inserts share the pool
+        extra = await asyncio.gather(*(table.add(AnalysisRow(input=AnalysisRequest())) for _ in range(10)))
+
+        ids = {r.id for r in rows} | {r.id for r in extra}
+        assert len(ids) == 40
+        assert await db.fetch_val("SELECT count(*) FROM analysisrow") == 40
+        await db.close()
+
+    asyncio.run(run())
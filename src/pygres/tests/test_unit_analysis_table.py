@@ -1,3 +1,4 @@
+import json
 from psycopg.types.json import Jsonb
 
 from pygres.examples.eg import AnalysisRow, AnalysisTable
@@ -28,9 +29,71 @@ def test_analysis_insert_basic():
     assert isinstance(db.last_params["input"], Jsonb) # type: ignore
 
     # The JSONB payload should contain the serialized request
-    assert db.last_params["input"].obj["files"][0]["content"] == "class Foo {}" # type: ignore
+    payload = db.last_params["input"] # type: ignore
+    encoded = payload.dumps(payload.obj)
+    assert isinstance(encoded, bytes)  # pydantic-core output, not re-encoded by psycopg
+    assert json.loads(encoded)["files"][0]["content"] == "class Foo {}"
 
     # The SQL should be an INSERT INTO ... RETURNING id
     sql_text = db.last_sql.as_string(None) # type: ignore
     assert "INSERT INTO" in sql_text
     assert "RETURNING id" in sql_text
+
+
+def test_analysis_add_many_copies_in_chunks():
+    db = FakeDB()
+    table = AnalysisTable(db)
+
+    rows = [
+        AnalysisRow(input=AnalysisRequest(files=[VirtualFile(content=f"class C{i} {{}}")]))
+        for i in range(5)
+    ]
+    inserted = table.add_many(iter(rows), chunk_size=2)
+
+    assert inserted == 5
+    assert [r.id for r in rows] == [42, 43, 42, 43, 42]
+
+    # Last chunk held a single row, id first, JSONB typed for binary COPY
+    assert len(db.copied_rows) == 1
+    assert db.copied_rows[0][0] == 42
+    assert db.copied_types[:2] == ["integer", "jsonb"]
+    assert "FORMAT BINARY" in db.last_sql.as_string(None)
+
+
+def test_analysis_statements_compiled_once_and_prepared():
+    db = FakeDB()
+    table = AnalysisTable(db)
+
+    table.add(AnalysisRow(input=AnalysisRequest()))
+    first_sql = db.last_sql
+    table.add(AnalysisRow(input=AnalysisRequest(files=[])))
+
+    # Same pre-rendered statement every call, executed server-side prepared
+    assert db.last_sql == first_sql
+    assert db.last_prepare is True
+    assert table.statements.insert.startswith(b'INSERT INTO "analysisrow"')
+
+    saved = AnalysisRow(input=AnalysisRequest(), id=7)
+    assert table.update(saved)
+    assert db.last_params["id"] == 7 # type: ignore
+    assert db.last_sql.as_string(None).startswith('UPDATE "analysisrow" SET') # type: ignore
+
+
+def test_analysis_iter_rows_builds_models():
+    db = FakeDB()
+    table = AnalysisTable(db)
+    stored = [
+        {"id": 1, "input": {"files": [{"content": "class A {}"}]}},
+        {"id": 2, "input": {"files": []}, "input_id": 1},
+    ]
+    db.stream_rows = [tuple(r.get(c) for c in table.read_columns) for r in stored]
+
+    db.last_sql = None
+    rows = table.iter_rows(where="input_id IS NOT NULL", batch_size=50)
+    assert db.last_sql is None  # nothing runs until iterated
+
+    loaded = list(rows)
+    assert [r.id for r in loaded] == [1, 2]
+    assert loaded[0].input.files[0].content == "class A {}" # type: ignore[index]
+    assert db.last_batch_size == 50
+    assert db.last_sql.as_string(None).endswith("WHERE input_id IS NOT NULL") # type: ignore
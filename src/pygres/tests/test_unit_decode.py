@@ -0,0 +1,43 @@
+import pytest
+from pydantic import ValidationError
+from pygres.examples.eg import AnalysisRow, AnalysisTable
+from pygres.examples.models import AnalysisRequest, BulkDiagramResponse, DiagramItem, VirtualFile
+from pygres.models.codec import RAW_JSONB_LOADERS
+from pygres.tests.base.fakedb import FakeDB
+
+RAW_INPUT = b'{"files": [{"content": "class Foo {}", "language": "cs"}], "options": null}'
+RAW_OUTPUT = b'{"content": [{"file": "Foo.cs", "diagram": "classDiagram"}], "processed": 1}'
+
+@pytest.mark.parametrize("decode", ["python", "json", "trusted"])
+def test_from_db_row_decode_modes_agree(decode):
+    row = {"id": 3, "input": RAW_INPUT, "output": RAW_OUTPUT, "input_id": None}
+    loaded = AnalysisRow.from_db_row(row, decode)
+
+    assert loaded.id == 3
+    # nested models are real models in every mode, including list items
+    assert isinstance(loaded.input, AnalysisRequest)
+    assert isinstance(loaded.input.files[0], VirtualFile) # type: ignore[index]
+    assert loaded.input.files[0].content == "class Foo {}" # type: ignore[index]
+    assert isinstance(loaded.output, BulkDiagramResponse)
+    assert isinstance(loaded.output.content[0], DiagramItem)
+    assert loaded.output.total_scanned == 0  # default filled in
+
+def test_from_db_row_json_validates_but_trusted_does_not():
+    bad = {"id": 1, "input": b'{"files": [{"content": 5}]}'}
+
+    with pytest.raises(ValidationError):
+        AnalysisRow.from_db_row(bad, "json")
+
+    assert AnalysisRow.from_db_row(bad, "trusted").input.files[0].content == 5 # type: ignore[index]
+
+def test_table_reads_request_raw_jsonb_loaders():
+    db = FakeDB()
+    table = AnalysisTable(db)
+    table.decode = "json"
+    db.stream_rows = [tuple({"id": 9, "input": RAW_INPUT}.get(c) for c in table.read_columns)]
+
+    loaded = table.get(9)
+
+    assert db.last_loaders == RAW_JSONB_LOADERS
+    assert loaded is not None
+    assert loaded.input.files[0].language == "cs" # type: ignore[index]
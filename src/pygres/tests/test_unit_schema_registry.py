@@ -0,0 +1,80 @@
+from pygres.examples.eg import AnalysisRow, AnalysisTable
+from pygres.models.base_model import PydanticTypeModel
+from pygres.schema.ddl import io_relationship_ddl
+from pygres.schema.registry import ensure_schema, forget_schema, schema_fingerprint
+from pygres.tests.base.fakedb import FakeDB
+
+class Job(PydanticTypeModel):
+    name: str
+
+class JobV2(PydanticTypeModel):
+    name: str
+    priority: int | None = None
+
+class Step(PydanticTypeModel):
+    job_id: int
+
+
+def test_fingerprint_tracks_columns_and_metadata(monkeypatch):
+    before = schema_fingerprint(Job)
+    assert schema_fingerprint(Job) == before
+    assert schema_fingerprint(JobV2) != before
+
+    monkeypatch.setitem(Job.schema_info()["metadata"], "create_uid", True)
+    assert schema_fingerprint(Job) != before
+
+
+def test_matching_fingerprint_skips_ddl():
+    db = FakeDB()
+    db.fetch_all_rows = [("job", schema_fingerprint(Job))]
+
+    assert ensure_schema(db, Job) == []
+
+    # registry probe and lookup, no DDL
+    assert len(db.calls) == 2
+    assert "CREATE TABLE" not in db.calls[-1].as_string(None)
+
+
+def test_stale_models_bootstrap_in_one_execute():
+    db = FakeDB()
+    db.fetch_all_rows = [("job", "outdated")]
+
+    assert ensure_schema(db, Job, Step) == ["job", "step"]
+
+    assert len(db.calls) == 3
+    script = db.calls[-1].as_string(None)
+    assert 'CREATE TABLE IF NOT EXISTS "job"' in script
+    assert 'CREATE TABLE IF NOT EXISTS "step"' in script
+    assert "pg_advisory_xact_lock" in script
+    assert script.rstrip().endswith("applied_at = now()")
+
+
+def test_second_table_object_makes_no_calls():
+    db = FakeDB()
+    AnalysisTable(db)
+    assert db.calls
+
+    db.calls.clear()
+    AnalysisTable(db)
+    assert db.calls == []
+
+    # after forgetting, the registry is consulted again
+    forget_schema(db, AnalysisRow)
+    AnalysisTable(db)
+    assert db.calls
+
+
+def test_io_relationship_is_idempotent(monkeypatch):
+    monkeypatch.setitem(Step.schema_info()["metadata"], "create_io_rel", True)
+    ddl = io_relationship_ddl("step", Step).as_string(None) # type: ignore[union-attr]
+
+    assert ddl.startswith("DO $$ BEGIN ALTER TABLE \"step\" ADD CONSTRAINT \"step_input_fk\"")
+    assert "EXCEPTION WHEN duplicate_object THEN NULL" in ddl
+
+
+def test_private_attributes_are_metadata_not_columns():
+    reg = AnalysisRow.schema_info()
+
+    assert "_create_uid" not in reg["sql_fields"]
+    assert reg["metadata"] == {"create_uid": True, "create_io_rel": True}
+    assert "created_at" in AnalysisTable(FakeDB()).columns